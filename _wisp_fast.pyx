@@ -0,0 +1,76 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional compiled helpers for unity_error_monitor.py
+
+unity_error_monitor.py works without this module. When it is built, the
+incremental log reader uses scan_objects instead of the pure-Python loop in
+UnityErrorMonitor._scan_objects.
+
+Build (next to unity_error_monitor.py):
+    pip install cython
+    cythonize -i _wisp_fast.pyx
+"""
+
+
+cpdef tuple scan_objects(const unsigned char[:] buf):
+    """
+    Find complete top-level {...} objects in a slice of the logs array
+
+    Same contract as UnityErrorMonitor._scan_objects:
+    Returns: (spans, end) where spans is a list of (start, stop) byte ranges
+    and end is the offset just past the last object, or (spans, None) if the
+    closing ] of the array was not reached
+    """
+    cdef list spans = []
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t start
+    cdef Py_ssize_t end = 0
+    cdef int depth
+    cdef bint in_string
+    cdef bint escaped
+    cdef bint closed
+    cdef unsigned char c
+
+    while i < n:
+        c = buf[i]
+        if c == 0x5D:  # ]
+            return spans, end
+        if c != 0x7B:  # {
+            i += 1
+            continue
+
+        start = i
+        depth = 0
+        in_string = False
+        escaped = False
+        closed = False
+        while i < n:
+            c = buf[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif c == 0x5C:  # backslash
+                    escaped = True
+                elif c == 0x22:  # "
+                    in_string = False
+            elif c == 0x22:
+                in_string = True
+            elif c == 0x7B:
+                depth += 1
+            elif c == 0x7D:  # }
+                depth -= 1
+                if depth == 0:
+                    closed = True
+                    break
+            i += 1
+
+        if not closed:
+            # Object was cut off mid-write
+            return spans, None
+
+        i += 1
+        spans.append((start, i))
+        end = i
+
+    return spans, None
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Regression tests for unity_error_monitor.py
+
+Usage:
+    python3 -m unittest test_unity_error_monitor
+"""
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import unity_error_monitor
+from unity_error_monitor import UnityErrorMonitor, log_identity
+
+
+def make_entry(timestamp, log_type="Error", message="NullReferenceException"):
+    """One entry as written by ErrorLogger.cs"""
+    return {
+        "timestamp": timestamp,
+        "logType": log_type,
+        "message": message,
+        "stackTrace": "Player.Update () (at Assets/Scripts/PlayerController.cs:42)",
+        "scene": "Main",
+    }
+
+
+def dump(entries):
+    """File content as written by JsonUtility.ToJson(logData, true)"""
+    return json.dumps({"logs": entries}, indent=4)
+
+
+class LogFileTestCase(unittest.TestCase):
+    """Monitor on a temporary log file that tests rewrite like ErrorLogger.cs"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.tmp, "unity_errors.json")
+        self.writes = 0
+        with redirect_stdout(io.StringIO()):
+            self.monitor = UnityErrorMonitor(self.log_file, debug_dir=os.path.join(self.tmp, "debug"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write(self, entries, text=None):
+        """Rewrite the whole file like File.WriteAllText (text: partial content)"""
+        with open(self.log_file, "w") as f:
+            f.write(dump(entries) if text is None else text)
+        # Give every write a distinct mtime so read_logs never short-circuits
+        self.writes += 1
+        os.utime(self.log_file, ns=(self.writes * 10**9, self.writes * 10**9))
+
+    def assertCached(self, logs, entries, msg=None):
+        """Compare decoded entries (dicts or msgspec structs) with plain dicts"""
+        self.assertEqual([log_identity(e) for e in logs], [log_identity(e) for e in entries], msg)
+
+
+class ReadStreamAlignmentTest(LogFileTestCase):
+    """Rewritten (trimmed) files must still report every new entry"""
+
+    @unittest.skipIf(unity_error_monitor.ijson is None, "ijson not installed")
+    def test_same_millisecond_burst_at_front_of_window(self):
+        # 10 identical entries (one frame's worth of Debug.LogError), then 90 others
+        entries = [make_entry("2025-01-01 00:00:00.000") for _ in range(10)]
+        entries += [make_entry(f"2025-01-01 00:00:{i:02}.500", "Warning", f"W{i}") for i in range(90)]
+        self.write(entries)
+        self.monitor.read_logs()
+
+        for i in range(12):
+            # ErrorLogger.cs: add the new entry, drop the oldest, save
+            entries = entries[1:] + [make_entry(f"2025-01-01 00:01:{i:02}.000", "Exception", f"NEW {i}")]
+            self.write(entries)
+            logs = self.monitor.read_logs()
+            self.assertCached(logs, entries, f"write {i}: cache out of step with the file")
+
+    @unittest.skipIf(unity_error_monitor.ijson is None, "ijson not installed")
+    def test_same_identity_with_different_stack_traces(self):
+        # Same message in the same millisecond from different call sites -
+        # only (logType, message, timestamp) is compared before skipping
+        entries = []
+        for i in range(10):
+            entry = make_entry("2025-01-01 00:00:00.000")
+            entry["stackTrace"] = f"Enemy{i}.Update () (at Assets/Scripts/EnemyController.cs:{i})"
+            entry["scene"] = f"Level{i % 2}"
+            entries.append(entry)
+        entries += [make_entry(f"2025-01-01 00:00:{i:02}.500", "Warning", f"W{i}") for i in range(90)]
+        self.write(entries)
+        self.monitor.read_logs()
+
+        for i in range(12):
+            entries = entries[1:] + [make_entry(f"2025-01-01 00:01:{i:02}.000", "Exception", f"NEW {i}")]
+            self.write(entries)
+            with redirect_stdout(io.StringIO()):
+                for entry in self.monitor.read_logs():
+                    self.monitor.process_log(entry)
+            self.assertIn(("Exception", f"NEW {i}"), self.monitor._pending,
+                          f"write {i}: new entry was not reported")
+            self.monitor._pending.clear()
+
+
+class ReadTailTest(LogFileTestCase):
+    """Incremental reads of appended entries (UnityErrorMonitor._read_tail)"""
+
+    def test_appended_entries_are_read_incrementally(self):
+        entries = [make_entry(f"2025-01-01 00:00:00.{i:03}") for i in range(3)]
+        self.write(entries)
+        self.monitor.read_logs()
+
+        with mock.patch.object(self.monitor, "_read_full", side_effect=AssertionError("full parse")):
+            for i in range(3, 8):
+                entries.append(make_entry(f"2025-01-01 00:00:00.{i:03}", "Exception", f"E{i}"))
+                self.write(entries)
+                self.assertCached(self.monitor.read_logs(), entries)
+
+    def test_trim_inside_burst_with_unchanged_head(self):
+        # The first HEAD_BYTES stay the same when one of 10 identical entries is
+        # trimmed, but everything after it shifts - the old tail offset now
+        # points into the middle of an entry
+        for streaming in (True, False):
+            with self.subTest(ijson=streaming and unity_error_monitor.ijson is not None):
+                ijson = unity_error_monitor.ijson if streaming else None
+                with mock.patch.object(unity_error_monitor, "ijson", ijson):
+                    self.monitor._reset_read_state()
+                    entries = [make_entry("2025-01-01 00:00:00.000") for _ in range(10)]
+                    entries += [make_entry(f"2025-01-01 00:00:{i:02}.500", "Warning", f"W{i}") for i in range(90)]
+                    self.write(entries)
+                    self.monitor.read_logs()
+
+                    for i in range(5):
+                        # Longer than the trimmed entry, so the file grows
+                        new = make_entry(f"2025-01-01 00:01:{i:02}.000", "Exception", f"NEW {i} " + "x" * 200)
+                        entries = entries[1:] + [new]
+                        self.write(entries)
+                        self.assertCached(self.monitor.read_logs(), entries, f"write {i}")
+
+    def test_partial_write_is_picked_up_next_tick(self):
+        entries = [make_entry(f"2025-01-01 00:00:00.{i:03}") for i in range(3)]
+        self.write(entries)
+        self.monitor.read_logs()
+
+        entries += [make_entry(f"2025-01-01 00:00:00.{i:03}", "Exception", f"E{i}") for i in range(3, 5)]
+        full = dump(entries)
+        # Caught mid-write: the first new entry is complete, the second isn't
+        cut = full.index('"E4"')
+        self.write(entries, text=full[:cut])
+        with redirect_stdout(io.StringIO()) as out:
+            self.assertCached(self.monitor.read_logs(), entries[:4])
+        self.assertFalse(self.monitor.read_complete)
+        self.assertEqual(out.getvalue(), "")
+
+        self.write(entries)
+        self.assertCached(self.monitor.read_logs(), entries)
+        self.assertTrue(self.monitor.read_complete)
+
+    def test_failed_decode_leaves_read_state_unchanged(self):
+        entries = [make_entry(f"2025-01-01 00:00:00.{i:03}") for i in range(3)]
+        self.write(entries)
+        self.monitor.read_logs()
+        state = (self.monitor._tail_offset, self.monitor._tail_buffer, self.monitor._tail_bytes)
+
+        entries += [make_entry(f"2025-01-01 00:00:00.{i:03}", "Exception", f"E{i}") for i in range(3, 5)]
+        full = dump(entries)
+        cut = full.index('"E4"')
+        self.write(entries, text=full[:cut])
+        with mock.patch.object(unity_error_monitor, "decode_log_entry", side_effect=json.JSONDecodeError("bad", "", 0)):
+            with redirect_stdout(io.StringIO()):
+                self.monitor.read_logs()
+        self.assertEqual((self.monitor._tail_offset, self.monitor._tail_buffer, self.monitor._tail_bytes), state)
+
+        self.write(entries)
+        self.assertCached(self.monitor.read_logs(), entries)
+
+
+class ScanObjectsTest(unittest.TestCase):
+    """The {...} scanner used by the tail reader (and its compiled twin)"""
+
+    def scanners(self):
+        yield UnityErrorMonitor._scan_objects
+        if unity_error_monitor.fast_scan_objects is not None:
+            yield unity_error_monitor.fast_scan_objects
+
+    def test_complete_objects_up_to_closing_bracket(self):
+        buf = b',\n    {"a": "}\\"{"}, {"b": {"c": 1}}\n  ]\n}'
+        for scan in self.scanners():
+            spans, end = scan(buf)
+            self.assertEqual([buf[a:b] for a, b in spans], [b'{"a": "}\\"{"}', b'{"b": {"c": 1}}'])
+            self.assertEqual(end, spans[-1][1])
+
+    def test_cut_off_object(self):
+        buf = b', {"a": 1}, {"b": "unfinis'
+        for scan in self.scanners():
+            spans, end = scan(buf)
+            self.assertEqual(spans, [(2, 10)])
+            self.assertIsNone(end)
+
+    def test_no_new_objects(self):
+        for scan in self.scanners():
+            self.assertEqual(scan(b"\n    ]\n}"), ([], 0))
+            self.assertEqual(scan(b""), ([], None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,14 +20,179 @@ Purpose: Real-time error monitoring for Unity games
 """
 
 import json
+import operator
 import os
 import sys
 import time
 import subprocess
 import platform
+import threading
+import queue
+import select
+import socket
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 
+# Optional faster JSON parser (pip install orjson) - falls back to stdlib json
+try:
+    import orjson
+    json_loads = orjson.loads
+    JSON_DECODE_ERRORS = (orjson.JSONDecodeError, json.JSONDecodeError)
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+    JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+# Optional streaming parser (pip install ijson) - lets a rewritten file be
+# re-read without rebuilding entries we already have
+try:
+    import ijson
+    JSON_DECODE_ERRORS += (ijson.JSONError,)
+except ImportError:
+    ijson = None
+
+# Optional typed decoder (pip install msgspec) - decodes entries straight into
+# LogEntry structs instead of dicts. Defaults match process_log's fallbacks.
+try:
+    import msgspec
+
+    class LogEntry(msgspec.Struct):
+        """One entry of ErrorLogger.cs's LogData.logs list"""
+        timestamp: str = "Unknown time"
+        logType: str = "Unknown"
+        message: str = "Unknown error"
+        stackTrace: str = ""
+        scene: str = "Unknown"
+
+    class LogFile(msgspec.Struct):
+        """Top level of unity_errors.json"""
+        logs: list[LogEntry] = []
+
+    _log_file_decoder = msgspec.json.Decoder(LogFile)
+    _log_entry_decoder = msgspec.json.Decoder(LogEntry)
+    JSON_DECODE_ERRORS += (msgspec.DecodeError,)
+except ImportError:
+    msgspec = None
+    LogEntry = None
+
+
+def decode_logs(data):
+    """Decode a whole log file (bytes) into its list of entries"""
+    if msgspec is not None:
+        return _log_file_decoder.decode(data).logs
+    return json_loads(data).get("logs", [])
+
+
+def decode_log_entry(data):
+    """Decode one {...} log entry (bytes)"""
+    if msgspec is not None:
+        return _log_entry_decoder.decode(data)
+    return json_loads(data)
+
+
+# Fields that identify a log entry (process_log dedups on the same three)
+IDENTITY_KEYS = {"logType", "message", "timestamp"}
+
+
+def log_identity(entry):
+    """Return (logType, message, timestamp) of a decoded entry or entry dict"""
+    if type(entry) is LogEntry:
+        return (entry.logType, entry.message, entry.timestamp)
+    return (entry.get("logType", "Unknown"),
+            entry.get("message", "Unknown error"),
+            entry.get("timestamp", "Unknown time"))
+
+
+def as_log_entry(entry):
+    """Convert a log entry dict (e.g. built by ijson) to the decoded entry type"""
+    if msgspec is not None:
+        return msgspec.convert(entry, LogEntry)
+    return entry
+
+# Optional compiled scanner (cythonize -i _wisp_fast.pyx) - same results as
+# UnityErrorMonitor._scan_objects without the per-byte Python loop
+try:
+    from _wisp_fast import scan_objects as fast_scan_objects
+except ImportError:
+    fast_scan_objects = None
+
+# Optional file system notifications (pip install watchdog) - wake up as soon
+# as Unity writes the log instead of polling every check_interval
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+# Operating system, looked up once - it never changes while we run
+SYSTEM = platform.system()
+
+# Command (+ display name) used to open a debug file, by operating system
+OPEN_COMMANDS = {
+    "Darwin": (["open", "-a", "Cursor"], "Cursor"),  # macOS
+    "Linux": (["code"], "VS Code"),
+    "Windows": (["start", "cursor"], "Cursor"),  # needs the shell
+}
+
+# Debug file content written by write_debug_file (filled in with str.format_map)
+DEBUG_TEMPLATE = """# {log_type}: {message}
+
+## Error Details
+- **Type:** {log_type}
+- **Timestamp:** {timestamp}
+- **Scene:** {scene}
+{occurrences_section}
+## Stack Trace
+```
+{stack_trace}
+```
+
+## Debugging Tips
+1. Check the error message above - what is it trying to tell you?
+2. Review the stack trace to find the problematic code location
+3. Look at the scene name - what was happening when this occurred?
+4. Common issues:
+   - NullReferenceException: Trying to use an object that doesn't exist
+   - OutOfRangeException: Accessing array/list index that's out of bounds
+   - ArgumentException: Invalid argument passed to a function
+   - MissingComponentException: Missing required component on GameObject
+
+## Next Steps
+1. Ask Claude Code: "Help me debug this {log_type}"
+2. Provide context about what was happening when the error occurred
+3. Ask for suggestions on how to fix the issue
+
+---
+*Auto-generated debug file from UnityErrorMonitor*
+"""
+
+
+class LogChangeHandler:
+    """
+    watchdog event handler that calls back when one specific file changes
+
+    The observer watches the whole log directory, so events for other files
+    (e.g. the cursor_debug folder) are ignored here.
+    """
+
+    # Events that mean the file's content may have changed. Opens and
+    # read-only closes (e.g. our own read_logs) are ignored.
+    WAKE_EVENTS = frozenset({"modified", "created", "moved", "closed"})
+
+    def __init__(self, log_file, on_change):
+        self.log_file = os.path.abspath(log_file)
+        self.on_change = on_change
+
+    def dispatch(self, event):
+        if event.event_type not in self.WAKE_EVENTS:
+            return
+
+        # Unity may write in place (modified/closed) or replace the file (created/moved)
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if path and os.path.abspath(os.fsdecode(path)) == self.log_file:
+                self.on_change()
+                return
+
 class UnityErrorMonitor:
     """
     Monitors Unity error log file and sends errors to Cursor
@@ -46,7 +211,20 @@ class UnityErrorMonitor:
     - Open files in Cursor IDE
     """
 
-    def __init__(self, log_file, check_interval=1, debug_dir=None):
+    HEAD_BYTES = 256  # Bytes compared to tell an append from a rewrite
+    MAX_TAIL_BUFFER = 1 << 20  # Largest partly written tail held back before a full parse
+    MAX_PARSE_FAILURES = 3  # Consecutive parse failures before the error is printed
+    WATCH_FALLBACK_INTERVAL = 10  # Safety-net poll (seconds) when watchdog is active
+    MAX_PROCESSED_LOGS = 10000    # Processed log IDs remembered (oldest forgotten first)
+    DEBOUNCE_INTERVAL = 0.2       # Quiet time (seconds) before a burst of errors is sent
+
+    # Maps every non-alphanumeric ASCII character to "_" (see write_debug_file)
+    _SAFE_TABLE = str.maketrans({c: "_" for c in map(chr, range(128)) if not c.isalnum()})
+
+    # Fetches every field of a dict log entry in one call (see process_log)
+    _FIELDS = operator.itemgetter("logType", "message", "timestamp", "stackTrace", "scene")
+
+    def __init__(self, log_file, check_interval=1, debug_dir=None, batch_size=50):
         """
         Initialize the error monitor
 
@@ -54,18 +232,57 @@ class UnityErrorMonitor:
         - log_file: Path to the unity_errors.json file created by ErrorLogger.cs
         - check_interval: How often to check for new logs (in seconds)
         - debug_dir: Where to save debug files (default: Logs/cursor_debug/)
+        - batch_size: Send queued errors to Cursor early once this many pile up
+          (otherwise they're sent once no new error arrives for DEBOUNCE_INTERVAL)
 
         Pseudocode:
         1. Store the log file path and check interval
         2. Initialize processed logs set (empty) - used to track which errors we've already seen
+           - Bounded to MAX_PROCESSED_LOGS entries so a long session doesn't leak memory
         3. Determine debug directory:
            - If not provided: use parent of log file + /cursor_debug/
            - Create directory if it doesn't exist
-        4. Print startup message with file paths
+        4. Start the background thread that writes debug files
+        5. Print startup message with file paths
         """
         self.log_file = log_file
         self.check_interval = check_interval
         self.processed_logs = set()  # Track processed logs to avoid duplicates
+        self._processed_order = deque()  # Same IDs, oldest first, to bound the set
+        self.batch_size = batch_size
+        self._pending = {}  # (logType, message) -> occurrences waiting for Cursor (see flush_pending)
+        self._pending_count = 0  # Total occurrences in _pending
+        self._newest_key = None  # Group of the most recent queued error
+        self._debounce_deadline = None  # time.monotonic() when _pending is due to be sent
+        self._children = []  # PIDs of launched editors not yet reaped (see _spawn)
+
+        # Editor command for this OS, looked up once (see open_in_cursor)
+        self._open_cmd, self._editor_name = OPEN_COMMANDS.get(SYSTEM, (None, None))
+
+        # Debug files are written by a background thread so disk I/O never
+        # blocks the monitor loop
+        self._write_q = queue.Queue(maxsize=256)
+        threading.Thread(target=self._writer_loop, daemon=True).start()
+
+        # Incremental read state (see read_logs)
+        self._last_size = -1          # File size at last read
+        self._last_mtime = None       # File mtime (ns) at last read
+        self._cached_logs = []        # Decoded entries seen so far
+        self._tail_offset = 0         # Byte offset just past the last parsed entry
+        self._head = b""              # First bytes of the file, used to detect rewrites
+        self._tail_bytes = b""        # Bytes just before _tail_offset, same purpose
+        self._tail_buffer = b""       # Partly written entry after _tail_offset
+        self._parse_failures = 0      # Consecutive failed parses (see read_logs)
+        self.read_complete = True     # False if the last read_logs should be retried
+
+        # The file watcher thread writes a byte here when the log file changes;
+        # the monitor loop blocks in select() on the other end. A socket pair
+        # rather than os.pipe() so select() also works on Windows.
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._observer = None
+        self._last_stat = None  # (mtime_ns, size) the monitor loop last acted on
 
         # Determine debug directory
         if debug_dir is None:
@@ -76,6 +293,8 @@ class UnityErrorMonitor:
 
         # Create debug directory if it doesn't exist
         self.debug_dir.mkdir(parents=True, exist_ok=True)
+        # Plain string prefix for debug file paths (no Path objects per error)
+        self._debug_dir_str = os.path.join(str(self.debug_dir), "")
 
         print(f"[UnityErrorMonitor] Initialized")
         print(f"  📁 Log file: {self.log_file}")
@@ -91,37 +310,354 @@ class UnityErrorMonitor:
         Returns: List of log entries, or empty list if file doesn't exist
 
         Pseudocode:
-        1. Check if log file exists
-           - If not: print waiting message, return empty list
-        2. Try to read the JSON file:
-           - Read entire file as text
-           - Parse JSON into Python dictionary
-           - Extract the "logs" array from the dictionary
-           - Return the list of logs
-        3. If any error occurs (JSON parse error, missing "logs" key, etc.):
+        1. Stat the log file
+           - If it doesn't exist: return empty list
+           - If size and mtime are unchanged: return the cached entries (no parse)
+        2. If the file only grew and its head is unchanged (Unity appended entries):
+           - Read just the new bytes after the last parsed entry
+           - Scan out each complete {...} object and parse it on its own
+           - Append the new entries to the cache
+        3. Otherwise (first read, file shrank, or was rewritten/trimmed):
+           - Read and parse the whole file once
+             (streamed with ijson when available, skipping cached entries)
+           - Remember where the last entry ends for the next incremental read
+        4. If the file is only partly written (Unity is mid-write):
+           - Keep the complete entries, hold back the partial one for next tick
+           - On a parse error: return the cached entries and retry next tick
+           - Only print the error if it keeps failing (MAX_PARSE_FAILURES)
+        5. If the file can't be read at all:
            - Print error message
            - Return empty list (graceful failure)
+
+        Sets read_complete to False when the caller should retry next tick.
         """
-        if not os.path.exists(self.log_file):
+        try:
+            stat = os.stat(self.log_file)
+        except FileNotFoundError:
             return []
+        except Exception as e:
+            print(f"[ERROR] Failed to read log file: {e}")
+            return []
+
+        # Nothing written since last tick
+        if stat.st_size == self._last_size and stat.st_mtime_ns == self._last_mtime:
+            return self._cached_logs
 
+        self.read_complete = True
         try:
-            with open(self.log_file, 'r') as f:
-                data = json.load(f)
-                return data.get("logs", [])
-        except json.JSONDecodeError as e:
-            print(f"[ERROR] Failed to parse JSON: {e}")
-            return []
+            with open(self.log_file, 'rb') as f:
+                grew = 0 <= self._last_size < stat.st_size
+                if not (grew and self._read_tail(f)):
+                    if ijson is not None and self._cached_logs:
+                        self._read_stream(f, stat.st_size)
+                    else:
+                        self._read_full(f)
+        except JSON_DECODE_ERRORS as e:
+            # Most likely caught Unity mid-write - keep what we have and retry
+            self.read_complete = False
+            self._parse_failures += 1
+            if self._parse_failures == self.MAX_PARSE_FAILURES:
+                print(f"[ERROR] Failed to parse JSON: {e}")
+            return self._cached_logs
         except Exception as e:
             print(f"[ERROR] Failed to read log file: {e}")
+            self._reset_read_state()
+            self.read_complete = False
             return []
 
+        self._parse_failures = 0
+        if self.read_complete:
+            self._last_size = stat.st_size
+            self._last_mtime = stat.st_mtime_ns
+        return self._cached_logs
+
+    def _reset_read_state(self):
+        """Forget incremental read state so the next read parses the whole file"""
+        self._last_size = -1
+        self._last_mtime = None
+        self._cached_logs = []
+        self._tail_offset = 0
+        self._tail_buffer = b""
+        self._head = b""
+        self._tail_bytes = b""
+
+    def _read_full(self, f):
+        """
+        Parse the whole log file and record where the last entry ends
+
+        Pseudocode:
+        1. Read all bytes and parse them as JSON
+           - Read into memory rather than memory-mapped: ErrorLogger.cs
+             truncates and rewrites the file in place, and touching a mapped
+             page past the new end of file kills the process (SIGBUS)
+        2. Record the tail offset for the next incremental read
+        """
+        f.seek(0)
+        data = f.read()
+        self._cached_logs = decode_logs(data)
+        self._remember_tail(data, 0, data[:self.HEAD_BYTES])
+
+    def _read_stream(self, f, size):
+        """
+        Re-read a rewritten log file with ijson, only building new entries
+
+        Parameters:
+        - f: Log file opened in binary mode
+        - size: Current file size in bytes
+
+        Pseudocode:
+        1. Walk the file's parse events with ijson (nothing is materialized yet)
+        2. For each entry, read its logType, message and timestamp first
+           - ErrorLogger.cs writes these before stackTrace, so a cached
+             entry is recognized before its (large) stack trace is built
+        3. Line the first entry up with the first cached entry of the same identity
+           - Unity only ever drops entries from the front, so the cached
+             entries from that point on should follow in the file, in order
+        4. Each later entry must match the next expected cached entry:
+           - Match: reuse the cached entry, skip the rest of its events
+           - Mismatch (e.g. identical entries from one millisecond lined the
+             file up too early): stop lining up and build it in full
+        5. Entries past the end of the cache are new - build them in full
+        6. Read just the start and end of the file to record the tail offset
+        """
+        f.seek(0)
+        events = iter(ijson.parse(f))
+        cached = self._cached_logs
+        cached_ids = [log_identity(entry) for entry in cached]
+        logs = []
+        expected = None  # Index of the cached entry the next file entry should match
+        for prefix, event, value in events:
+            if prefix != "logs.item" or event != "start_map":
+                continue
+
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            index = None
+            checked = False
+            for prefix, event, value in events:
+                builder.event(event, value)
+                if prefix == "logs.item" and event == "end_map":
+                    break
+
+                # Check the entry as soon as its identity fields have been read
+                if not checked and event == "string" and IDENTITY_KEYS <= builder.value.keys():
+                    checked = True
+                    index = self._match_cached(cached_ids, expected, log_identity(builder.value))
+                    if index is not None:
+                        # Already cached - consume its events without building it
+                        self._skip_entry(events)
+                        break
+
+            if not checked:
+                index = self._match_cached(cached_ids, expected, log_identity(builder.value))
+
+            if index is not None:
+                logs.append(cached[index])
+                expected = index + 1
+            else:
+                logs.append(as_log_entry(builder.value))
+                expected = len(cached)  # Everything from here on is built in full
+
+        self._cached_logs = logs
+
+        f.seek(0)
+        head = f.read(self.HEAD_BYTES)
+        base = max(0, size - self.HEAD_BYTES)
+        f.seek(base)
+        self._remember_tail(f.read(), base, head)
+
+    @staticmethod
+    def _match_cached(cached_ids, expected, identity):
+        """
+        Find the cached entry a file entry corresponds to
+
+        Parameters:
+        - cached_ids: log_identity() of every cached entry, in order
+        - expected: Index of the cached entry that should come next, or None
+          if the file hasn't been lined up with the cache yet
+        - identity: log_identity() of the file entry
+
+        Returns: Index into the cache, or None if the entry must be built
+        """
+        if expected is None:
+            try:
+                return cached_ids.index(identity)
+            except ValueError:
+                return None
+        if expected < len(cached_ids) and cached_ids[expected] == identity:
+            return expected
+        return None
+
+    @staticmethod
+    def _skip_entry(events):
+        """Consume ijson events up to the end of the current logs entry"""
+        for prefix, event, value in events:
+            if prefix == "logs.item" and event == "end_map":
+                return
+
+    def _remember_tail(self, buf, base, head):
+        """
+        Record where the last entry ends so the next read can start there
+
+        Parameters:
+        - buf: Bytes from the end of the file (or the whole file)
+        - base: File offset of buf[0]
+        - head: First bytes of the file
+
+        Pseudocode:
+        1. Find the closing ] of the logs array (last ] in the file)
+        2. Step back over whitespace - the tail offset is just past the
+           last entry's } (or just past [ if the array is empty)
+        3. Remember the first bytes of the file and the bytes just before the
+           tail offset to detect rewrites later
+        """
+        self._tail_buffer = b""
+        close = buf.rfind(b"]")
+        end = close
+        while end > 0 and buf[end - 1] in b" \t\r\n":
+            end -= 1
+        if close < 0 or buf[end - 1:end] not in (b"}", b"["):
+            # Unexpected layout - always fall back to a full parse
+            self._tail_offset = 0
+            self._head = b""
+            self._tail_bytes = b""
+            return
+
+        self._tail_offset = base + end
+        self._head = head[:self._tail_offset]
+        self._tail_bytes = buf[max(0, end - self.HEAD_BYTES):end]
+
+    def _read_tail(self, f):
+        """
+        Parse only the entries appended since the last read
+
+        Returns: True if the new entries were read, False if a full parse is needed
+
+        Pseudocode:
+        1. Check the head of the file still matches what we saw last time
+           - Unity rewrites the whole file; when it trims the oldest entry
+             the first entry (and its timestamp) usually changes
+        2. Check the bytes just before the tail offset are unchanged too
+           - A trim inside a burst of identical entries leaves the head as
+             it was but shifts everything after it
+        3. Seek past the tail offset (and any held-back partial entry) and
+           read the appended bytes, prepending the held-back bytes
+           - They must start between entries (",", "{" or "]"), not mid-entry
+        4. Scan out the complete {...} objects and parse each one
+        5. Append them to the cache and move the tail offset forward
+        6. If the array's closing ] wasn't reached (Unity is mid-write):
+           - Hold back the unparsed bytes for the next tick
+           - Give up and do a full parse if they exceed MAX_TAIL_BUFFER
+        """
+        if not self._tail_offset or f.read(len(self._head)) != self._head:
+            return False
+
+        f.seek(self._tail_offset - len(self._tail_bytes))
+        if f.read(len(self._tail_bytes)) != self._tail_bytes:
+            return False
+
+        f.seek(self._tail_offset + len(self._tail_buffer))
+        delta = self._tail_buffer + f.read()
+        first = delta.lstrip(b" \t\r\n")[:1]
+        if first not in (b"", b",", b"{", b"]"):
+            return False
+        scan_objects = fast_scan_objects or self._scan_objects
+        spans, end = scan_objects(delta)
+        partial = end is None
+        if partial:
+            # Keep the complete entries, hold back the rest until it's written
+            end = spans[-1][1] if spans else 0
+            if len(delta) - end > self.MAX_TAIL_BUFFER:
+                return False
+
+        # Decode before touching any read state, so a failed decode leaves
+        # the next tick to retry from the same place
+        new_logs = [decode_log_entry(delta[start:stop]) for start, stop in spans]
+
+        if partial:
+            self._tail_buffer = delta[end:]
+            self.read_complete = False
+        else:
+            self._tail_buffer = b""
+
+        self._cached_logs.extend(new_logs)
+        self._tail_bytes = (self._tail_bytes + delta[:end])[-self.HEAD_BYTES:]
+        self._tail_offset += end
+
+        # The head may have been short (e.g. an empty array) - top it up
+        if len(self._head) < self.HEAD_BYTES:
+            f.seek(0)
+            self._head = f.read(min(self._tail_offset, self.HEAD_BYTES))
+        return True
+
+    @staticmethod
+    def _scan_objects(buf):
+        """
+        Find complete top-level {...} objects in a slice of the logs array
+
+        Parameters:
+        - buf: Bytes starting just after the last parsed entry
+
+        Returns: (spans, end) where spans is a list of (start, stop) byte ranges
+        and end is the offset just past the last object, or (spans, None) if the
+        closing ] of the array was not reached
+
+        Pseudocode:
+        1. Skip whitespace and commas between entries
+        2. On {: track brace depth, skipping over quoted strings and escapes
+        3. When depth returns to zero: record the object's byte range
+        4. Stop at the array's closing ]
+        """
+        spans = []
+        end = 0
+        i = 0
+        n = len(buf)
+        while i < n:
+            c = buf[i]
+            if c == 0x5D:  # ]
+                return spans, end
+            if c != 0x7B:  # {
+                i += 1
+                continue
+
+            start = i
+            depth = 0
+            in_string = False
+            escaped = False
+            while i < n:
+                c = buf[i]
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif c == 0x5C:  # backslash
+                        escaped = True
+                    elif c == 0x22:  # "
+                        in_string = False
+                elif c == 0x22:
+                    in_string = True
+                elif c == 0x7B:
+                    depth += 1
+                elif c == 0x7D:  # }
+                    depth -= 1
+                    if depth == 0:
+                        break
+                i += 1
+            else:
+                # Object was cut off mid-write
+                return spans, None
+
+            i += 1
+            spans.append((start, i))
+            end = i
+
+        return spans, None
+
     def process_log(self, log_entry):
         """
         Process a single log entry and create debug file if needed
 
         Parameters:
-        - log_entry: Dictionary containing one log entry with keys:
+        - log_entry: Dictionary (or LogEntry struct, with msgspec) containing one log entry with keys:
           - timestamp: When it occurred
           - logType: Type of log ("Error", "Exception", "Assert", "Warning", "Log")
           - message: The error message
@@ -131,36 +667,54 @@ class UnityErrorMonitor:
         Pseudocode:
         1. Extract log type, message, timestamp from entry
         2. Create unique identifier for this log
-           - Use: logType + message + timestamp (prevents duplicates)
+           - Use: hash of (logType, message, timestamp) (prevents duplicates)
         3. Check if we've already processed this exact log
            - If yes: Skip it (return without action)
            - If no: Continue processing
         4. Add this log to processed set (mark as seen)
+           - If the set is full: forget the oldest ID
         5. Check if this is an error type we should send to Cursor
            - Only send: Error, Exception, Assert
            - Skip: Warning, Log
         6. If sending to Cursor:
-           - Extract stack trace (if available)
-           - Determine scene name (or use "Unknown")
-           - Create debug file with error details
-           - Open the file in Cursor
+           - Queue the error with its stack trace and scene, grouped by
+             (logType, message)
+           - Push the debounce deadline back to now + DEBOUNCE_INTERVAL
+           - Flush early if batch_size errors are waiting
+           - (monitor flushes the rest once the deadline passes - see flush_pending)
         """
         # Extract log information
-        log_type = log_entry.get("logType", "Unknown")
-        message = log_entry.get("message", "Unknown error")
-        timestamp = log_entry.get("timestamp", "Unknown time")
-        stack_trace = log_entry.get("stackTrace", "")
-        scene = log_entry.get("scene", "Unknown")
+        if type(log_entry) is LogEntry:
+            # Decoded by msgspec - defaults are already filled in
+            log_type = log_entry.logType
+            message = log_entry.message
+            timestamp = log_entry.timestamp
+            stack_trace = log_entry.stackTrace
+            scene = log_entry.scene
+        else:
+            try:
+                # ErrorLogger.cs always writes every field
+                log_type, message, timestamp, stack_trace, scene = self._FIELDS(log_entry)
+            except KeyError:
+                log_type = log_entry.get("logType", "Unknown")
+                message = log_entry.get("message", "Unknown error")
+                timestamp = log_entry.get("timestamp", "Unknown time")
+                stack_trace = log_entry.get("stackTrace", "")
+                scene = log_entry.get("scene", "Unknown")
 
         # Create unique identifier for this log (prevent duplicates)
-        log_id = f"{log_type}:{message}:{timestamp}"
+        # - a 64-bit int, so the set stores no message text and no key string is built
+        log_id = hash((log_type, message, timestamp))
 
         # Skip if already processed
         if log_id in self.processed_logs:
             return
 
-        # Mark as processed
+        # Mark as processed (forgetting the oldest once we hit the cap)
         self.processed_logs.add(log_id)
+        self._processed_order.append(log_id)
+        if len(self._processed_order) > self.MAX_PROCESSED_LOGS:
+            self.processed_logs.discard(self._processed_order.popleft())
 
         # Only send errors, exceptions, and assertions to Cursor
         # (Skip warnings and regular log messages)
@@ -169,13 +723,50 @@ class UnityErrorMonitor:
             print(f"[{log_type}] {message}")
             return
 
-        # Send to Cursor
-        print(f"\n🚨 [SENDING TO CURSOR] {log_type}: {message}")
-        self.send_to_cursor(log_type, message, stack_trace, scene, timestamp)
+        # Queue for Cursor, grouped by (log type, message) - sent by
+        # flush_pending once no new error has arrived for DEBOUNCE_INTERVAL
+        key = (log_type, message)
+        self._pending.setdefault(key, []).append((timestamp, stack_trace, scene))
+        self._pending_count += 1
+        self._newest_key = key
+        self._debounce_deadline = time.monotonic() + self.DEBOUNCE_INTERVAL
+        if self._pending_count >= self.batch_size:
+            self.flush_pending()
+
+    def flush_pending(self):
+        """
+        Send all queued errors to Cursor, coalescing repeats
+
+        Pseudocode:
+        1. Take the queued groups - process_log groups errors by
+           (logType, message), so a burst of the same error from an Update
+           loop is one group
+        2. For each group: write one debug file listing every occurrence
+        3. Open only the newest debug file in Cursor (one launch per burst)
+        4. Clear the queue and the debounce deadline
+        """
+        if not self._pending:
+            return
+
+        groups = self._pending
+        newest_key = self._newest_key
+        self._pending = {}
+        self._pending_count = 0
+        self._newest_key = None
+        self._debounce_deadline = None
+
+        # Only the newest error's file is opened in Cursor
+        for (log_type, message), occurrences in groups.items():
+            count = f" (x{len(occurrences)})" if len(occurrences) > 1 else ""
+            print(f"\n🚨 [SENDING TO CURSOR] {log_type}: {message}{count}")
+            timestamp, stack_trace, scene = occurrences[-1]
+            self.write_debug_file(log_type, message, stack_trace, scene, timestamp, occurrences,
+                                  open_file=(log_type, message) == newest_key)
 
-    def send_to_cursor(self, log_type, message, stack_trace, scene, timestamp):
+    def write_debug_file(self, log_type, message, stack_trace, scene, timestamp, occurrences=(),
+                         open_file=False):
         """
-        Create debug file and open in Cursor
+        Create a debug file for one error (or one burst of the same error)
 
         Parameters:
         - log_type: Type of error ("Error", "Exception", "Assert")
@@ -183,6 +774,11 @@ class UnityErrorMonitor:
         - stack_trace: Full call stack
         - scene: Scene where error occurred
         - timestamp: When error occurred
+        - occurrences: Optional list of (timestamp, stack_trace, scene) for
+          every time this error was seen in a burst
+        - open_file: Open the file in Cursor once it has been written
+
+        Returns: Path to the debug file as a string (written in the background)
 
         Pseudocode:
         1. Create a timestamped filename for the debug file
@@ -192,56 +788,63 @@ class UnityErrorMonitor:
            - Error type and message as heading
            - Timestamp
            - Scene information
+           - Every occurrence (if the error repeated)
            - Stack trace
            - Helpful debugging tips
-        3. Write formatted content to debug file
-        4. Print confirmation message
-        5. Try to open file in Cursor IDE:
-           - On macOS: Use 'open -a Cursor' command
-           - On Linux: Use 'code' or 'cursor' command
-           - On Windows: Use 'start cursor' command
-           - If open fails: print message suggesting manual opening
+        3. Hand the file to the background writer thread (see _writer_loop)
+           - If its queue is full: wait for room
         """
         # Create debug filename
         now = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         # Sanitize message for filename (remove unsafe characters)
-        safe_message = "".join(c if c.isalnum() else "_" for c in message[:50])
+        safe_message = message[:50].translate(self._SAFE_TABLE)
+        if not safe_message.isascii():
+            # Rare non-ASCII message - fall back to the Unicode-aware check
+            safe_message = "".join(c if c.isalnum() else "_" for c in message[:50])
         debug_filename = f"{now}_{log_type}_{safe_message}.md"
-        debug_file = self.debug_dir / debug_filename
+        debug_file = self._debug_dir_str + debug_filename
+
+        # List every occurrence when the same error repeated in a burst
+        occurrences_section = ""
+        if len(occurrences) > 1:
+            lines = "\n".join(f"- {when} ({where})" for when, _, where in occurrences)
+            occurrences_section = f"- **Occurrences:** {len(occurrences)}\n\n## Occurrences\n{lines}\n"
 
         # Create formatted debug content
-        debug_content = f"""# {log_type}: {message}
+        debug_content = DEBUG_TEMPLATE.format_map({
+            "log_type": log_type,
+            "message": message,
+            "timestamp": timestamp,
+            "scene": scene,
+            "occurrences_section": occurrences_section,
+            "stack_trace": stack_trace if stack_trace else 'No stack trace available',
+        })
 
-## Error Details
-- **Type:** {log_type}
-- **Timestamp:** {timestamp}
-- **Scene:** {scene}
+        # Write debug file off the monitor thread. Always through the queue
+        # (blocking if it's full) so files are written and opened in order,
+        # and only the writer thread ever launches the editor.
+        self._write_q.put((debug_file, debug_content, open_file))
 
-## Stack Trace
-```
-{stack_trace if stack_trace else 'No stack trace available'}
-```
-
-## Debugging Tips
-1. Check the error message above - what is it trying to tell you?
-2. Review the stack trace to find the problematic code location
-3. Look at the scene name - what was happening when this occurred?
-4. Common issues:
-   - NullReferenceException: Trying to use an object that doesn't exist
-   - OutOfRangeException: Accessing array/list index that's out of bounds
-   - ArgumentException: Invalid argument passed to a function
-   - MissingComponentException: Missing required component on GameObject
+        return debug_file
 
-## Next Steps
-1. Ask Claude Code: "Help me debug this {log_type}"
-2. Provide context about what was happening when the error occurred
-3. Ask for suggestions on how to fix the issue
+    def _writer_loop(self):
+        """Background thread: write queued debug files until the program exits"""
+        while True:
+            debug_file, debug_content, open_file = self._write_q.get()
+            try:
+                self._write_debug_file(debug_file, debug_content, open_file)
+            finally:
+                self._write_q.task_done()
 
----
-*Auto-generated debug file from UnityErrorMonitor*
-"""
+    def _write_debug_file(self, debug_file, debug_content, open_file):
+        """
+        Write one debug file to disk
 
-        # Write debug file
+        Pseudocode:
+        1. Write the formatted content to the debug file
+        2. Print confirmation message (or the error, and stop)
+        3. If requested: open the file in Cursor
+        """
         try:
             with open(debug_file, 'w') as f:
                 f.write(debug_content)
@@ -251,7 +854,8 @@ class UnityErrorMonitor:
             return
 
         # Try to open in Cursor
-        self.open_in_cursor(debug_file)
+        if open_file:
+            self.open_in_cursor(debug_file)
 
     def open_in_cursor(self, file_path):
         """
@@ -261,69 +865,185 @@ class UnityErrorMonitor:
         - file_path: Path to the file to open
 
         Pseudocode:
-        1. Detect operating system (macOS, Linux, Windows)
-        2. Try to open file with appropriate command:
+        1. Try to open file with the command chosen for this OS in __init__:
            - macOS: Use 'open -a Cursor' (Cursor app in Applications folder)
            - Linux: Try 'code' or 'cursor' command
            - Windows: Use 'start cursor' command
-        3. If command succeeds:
+        2. If command succeeds:
            - Print success message
-        4. If command fails:
+        3. If command fails (or the OS is unsupported):
            - Print message suggesting manual opening
            - User can open the file from Logs/cursor_debug/ folder
         """
-        system = platform.system()
+        if self._open_cmd is None:
+            print(f"  ⚠️  Unsupported OS: {SYSTEM}")
+            print(f"     Please open manually: {file_path}")
+            return
 
         try:
-            if system == "Darwin":  # macOS
-                subprocess.Popen(["open", "-a", "Cursor", str(file_path)])
-                print(f"  🔓 Opening in Cursor...")
-            elif system == "Linux":
-                subprocess.Popen(["code", str(file_path)])
-                print(f"  🔓 Opening in VS Code...")
-            elif system == "Windows":
-                subprocess.Popen(["start", "cursor", str(file_path)], shell=True)
-                print(f"  🔓 Opening in Cursor...")
-            else:
-                print(f"  ⚠️  Unsupported OS: {system}")
-                print(f"     Please open manually: {file_path}")
+            self._spawn(self._open_cmd + [str(file_path)], shell=SYSTEM == "Windows")
+            print(f"  🔓 Opening in {self._editor_name}...")
         except Exception as e:
             print(f"  ⚠️  Could not open in Cursor automatically: {e}")
             print(f"     Please open manually: {file_path}")
 
+    def _spawn(self, args, shell=False):
+        """
+        Launch a program without waiting for it
+
+        Only called from the writer thread (via open_in_cursor), so
+        _children is never touched by two threads at once.
+
+        Pseudocode:
+        1. Reap any earlier launches that have exited (avoid zombie processes)
+        2. On POSIX: start it with os.posix_spawnp (no fork of this process)
+        3. Otherwise (or for shell commands): fall back to subprocess.Popen
+        """
+        if shell or not hasattr(os, "posix_spawnp"):
+            subprocess.Popen(args, shell=shell)
+            return
+
+        for pid in list(self._children):
+            try:
+                if os.waitpid(pid, os.WNOHANG)[0]:
+                    self._children.remove(pid)
+            except ChildProcessError:
+                self._children.remove(pid)
+
+        self._children.append(os.posix_spawnp(args[0], args, os.environ))
+
     def monitor(self):
         """
         Main monitoring loop
 
-        Runs continuously, checking for new logs every `check_interval` seconds
+        Runs continuously, checking for new logs whenever the file changes
 
         Pseudocode:
-        1. Enter infinite loop
-        2. Read current logs from JSON file
-        3. For each log entry:
-           - Process it (check if error, send to Cursor if needed)
-        4. Sleep for check_interval seconds
-        5. Repeat (loop back to step 2)
+        1. Start a file watcher on the log directory (if watchdog is installed)
+        2. Enter infinite loop
+        3. If the file's mtime and size are unchanged: skip to step 6
+        4. Read current logs from JSON file
+        5. For each log entry:
+           - Process it (check if error, queue for Cursor if needed)
+        6. If the debounce deadline has passed (no new error for
+           DEBOUNCE_INTERVAL): send the queued errors to Cursor as one batch
+        7. Block in select() until the watcher reports a change
+           - Fall back to polling every check_interval without watchdog,
+             or every WATCH_FALLBACK_INTERVAL as a safety net with it
+           - Wake up early for a pending debounce deadline
+        8. Repeat (loop back to step 3)
 
         The loop runs until Ctrl+C is pressed (KeyboardInterrupt)
         """
+        timeout = self.check_interval
+        if self._start_watcher():
+            timeout = max(self.check_interval, self.WATCH_FALLBACK_INTERVAL)
+
         try:
             while True:
-                # Read current logs from file
-                logs = self.read_logs()
+                # Skip reading if Unity hasn't written anything
+                if self._log_changed():
+                    # Read current logs from file
+                    logs = self.read_logs()
+                    if not self.read_complete:
+                        # Caught Unity mid-write - retry next tick
+                        self._last_stat = None
+
+                    # Process each log entry
+                    for log_entry in logs:
+                        self.process_log(log_entry)
 
-                # Process each log entry
-                for log_entry in logs:
-                    self.process_log(log_entry)
+                # Send queued errors to Cursor once the burst has gone quiet
+                wait = timeout
+                if self._debounce_deadline is not None:
+                    remaining = self._debounce_deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.flush_pending()
+                    else:
+                        wait = min(wait, remaining)
 
-                # Wait before checking again
-                time.sleep(self.check_interval)
+                # Wait for the next change (or the fallback poll)
+                ready, _, _ = select.select([self._wake_r], [], [], wait)
+                if ready:
+                    self._drain_wakeups()
 
         except KeyboardInterrupt:
             # User pressed Ctrl+C
             print("\n[UnityErrorMonitor] Stopped (Ctrl+C)")
+            self._stop_watcher()
+            self.flush_pending()
+            self._write_q.join()  # Finish writing queued debug files
             sys.exit(0)
 
+    def _log_changed(self):
+        """
+        Check whether the log file changed since the last tick
+
+        Returns: True if mtime or size differ from the last check (one stat call)
+        """
+        try:
+            stat = os.stat(self.log_file)
+            current = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            current = None
+
+        if current == self._last_stat:
+            return False
+        self._last_stat = current
+        return True
+
+    def _on_change(self):
+        """Called from the watcher thread - wake up the monitor loop"""
+        try:
+            self._wake_w.send(b"x")
+        except BlockingIOError:
+            pass  # Buffer full - a wake-up is already pending
+
+    def _drain_wakeups(self):
+        """Discard queued wake-up bytes (one pass of the loop handles them all)"""
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _start_watcher(self):
+        """
+        Start watching the log directory for changes
+
+        Returns: True if the watcher is running, False to fall back to polling
+
+        Pseudocode:
+        1. If watchdog isn't installed or the log directory doesn't exist: return False
+        2. Schedule a LogChangeHandler on the log file's directory (not recursive)
+        3. Start the observer thread
+        """
+        if Observer is None:
+            return False
+
+        log_dir = os.path.dirname(os.path.abspath(self.log_file))
+        if not os.path.isdir(log_dir):
+            return False
+
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(LogChangeHandler(self.log_file, self._on_change), log_dir)
+            observer.start()
+        except Exception as e:
+            print(f"[UnityErrorMonitor] File watcher unavailable, polling instead: {e}")
+            return False
+
+        self._observer = observer
+        print(f"[UnityErrorMonitor] Watching {log_dir} for changes")
+        return True
+
+    def _stop_watcher(self):
+        """Stop the file watcher thread, if one is running"""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
 
 def find_log_file():
     """